@@ -13,18 +13,25 @@ Targets the exact schema defined in:
 
 Key design decisions:
   • BIGINT GENERATED ALWAYS AS IDENTITY PKs (animals, weights, epds, etc.)
-    are handled by inserting in dependency order and using subqueries
-    (SELECT animal_id FROM animals WHERE registration_number = ...) everywhere
-    a child table needs the parent's PK — never hardcoded IDs.
+    are handled by inserting in dependency order; child tables resolve the
+    parent PKs from natural keys (registration_number, program / vaccine
+    name) with one join per INSERT ... SELECT FROM (VALUES ...) batch —
+    never hardcoded IDs.
   • UUID PKs (users, herds, token_pools, ownership, transactions) are
-    generated in Python with uuid4() and embedded as literals.
+    derived in Python from a stable key (user slug, herd name, ...) with a
+    keyed BLAKE2b hash and embedded as literals.
   • contract_address and blockchain_tx_hash are intentionally NULL.
-  • random.seed(42) makes every run produce identical SQL.
+  • Bulk sections built as RowBlocks are rendered as multi-row INSERTs in
+    the SQL output, but streamed with COPY ... FROM STDIN under --execute;
+    child tables are COPYed into a temp stage table and joined from there.
+  • NP_RNG = np.random.default_rng(42), the only source of randomness, plus
+    the key-derived UUIDs make every run produce identical SQL.
 
 Usage:
-    pip install faker
+    pip install faker numpy
     python seed.py                        # print SQL to stdout
     python seed.py --output seed.sql      # write to file
+    python seed.py --batch-size 1000      # rows per multi-row INSERT (default 500)
     python seed.py --execute \\
         --host localhost --port 5432 \\
         --dbname cattle_dev --user postgres --password secret
@@ -53,48 +60,55 @@ Sources:
 from __future__ import annotations
 
 import argparse
-import random
+import functools
+import hashlib
+import io
+import itertools
+import sys
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, timedelta
-from typing import Optional, Dict
+from typing import Optional, Dict, TextIO, Union
+
+import numpy as np
 
 from utils import (
-    AnimalMetrics,
-    calculate_genetics_score,
-    calculate_health_score,
-    calculate_sustainability_score,
-    calculate_certification_score,
-    calculate_total_value,
+    STAGE_INDEX,
+    AnimalMetricsArrays,
+    calculate_valuations,
     calculate_projected_roi,
-    derive_listing_price_from_valuations,
-    grade_premium,
-    quality_multiplier,
-    sustainability_multiplier,
 )
 
 # ---------------------------------------------------------------------------
 # Global RNG — seed for reproducibility
 # ---------------------------------------------------------------------------
 
-random.seed(42)
-RNG = random.Random(42)
+# Every random draw comes from NumPy's Generator: one C-level call per
+# variable per batch instead of one random.* call per animal.
+NP_RNG = np.random.default_rng(42)
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def uid() -> str:
-    return str(uuid.uuid4())
+_UID_KEY = b"seed42"
 
 
-def rnd_date(start: date, end: date) -> date:
-    return start + timedelta(days=random.randint(0, (end - start).days))
+def uid(key: str) -> str:
+    """
+    Deterministic UUID for a stable content key, e.g. uid(f"user:{slug}").
+    No RNG involved, so IDs don't shift when generation order changes.
+    """
+    b = bytearray(hashlib.blake2b(key.encode(), digest_size=16, key=_UID_KEY).digest())
+    b[6] = (b[6] & 0x0F) | 0x80     # version 8 (custom)
+    b[8] = (b[8] & 0x3F) | 0x80     # RFC 9562 variant
+    return str(uuid.UUID(bytes=bytes(b)))
 
 
-def days_ago(n: int) -> date:
-    return date.today() - timedelta(days=n)
+def days_ago(n: int, today: Optional[date] = None) -> date:
+    """Pass today= from loops so date.today() isn't re-read for every row."""
+    return (today or date.today()) - timedelta(days=n)
 
 
 def q(v) -> str:
@@ -105,15 +119,160 @@ def q(v) -> str:
         return "TRUE" if v else "FALSE"
     if isinstance(v, (int, float)):
         return str(v)
+    if isinstance(v, date):
+        return q_date(v)
     return "'" + str(v).replace("'", "''") + "'"
 
 
-def animal_subq(reg: str) -> str:
-    return f"(SELECT animal_id FROM animals WHERE registration_number = {q(reg)} LIMIT 1)"
+# Type-specific variants of q() for the string-built INSERT loops, where the
+# type is known at the call site and the isinstance chain is wasted work.
+
+def q_str(s: str) -> str:
+    return "'" + s.replace("'", "''") + "'"
+
+
+def q_bool(b: bool) -> str:
+    return "TRUE" if b else "FALSE"
+
+
+def q_date(d: date) -> str:
+    """Typed DATE literal, so VALUES columns need no ::date cast downstream."""
+    return "DATE '" + d.isoformat() + "'"
+
+
+# Memoized q_str for low-cardinality text (breeds, vets, vaccines, traits,
+# ...), which repeats across thousands of rows with a handful of values
+q_label = functools.lru_cache(maxsize=None)(q_str)
+
+# Literal renderer per RowBlock source column type
+SQL_LITERAL = {"text": q_str, "date": q_date, "boolean": q_bool, "numeric": str, "integer": str}
+
+
+# Rows per multi-row INSERT ... VALUES statement (--batch-size)
+DEFAULT_BATCH_SIZE = 500
+
+
+def insert_rows(table: str, cols: str, rows: list[str],
+                batch_size: int = DEFAULT_BATCH_SIZE, suffix: str = "") -> list[str]:
+    """
+    Fold pre-rendered "(...)" value tuples into multi-row INSERT statements
+    of at most batch_size rows each — one parse/plan per batch, not per row.
+    suffix (e.g. an ON CONFLICT clause) is appended to every statement.
+    """
+    head = f"INSERT INTO {table} ({cols}) VALUES\n  "
+    return [
+        head + ",\n  ".join(rows[i:i + batch_size]) + suffix + ";"
+        for i in range(0, len(rows), batch_size)
+    ]
+
+
+def insert_join_rows(table: str, cols: str, select: str, rows: list[str],
+                     batch_size: int = DEFAULT_BATCH_SIZE, suffix: str = "") -> list[str]:
+    """
+    Multi-row INSERT ... SELECT for child tables. Each batch of value tuples
+    becomes an inline VALUES list substituted into select's "{values}", which
+    resolves foreign keys with one join per batch instead of a scalar
+    subquery per row.
+    """
+    head = f"INSERT INTO {table} ({cols})\n"
+    return [
+        head + select.format(values=",\n  ".join(rows[i:i + batch_size])) + suffix + ";"
+        for i in range(0, len(rows), batch_size)
+    ]
+
 
+@dataclass
+class RowBlock:
+    """
+    A bulk-table section kept as raw value tuples, so the same rows can be
+    rendered as multi-row INSERTs (--output / stdout) or streamed with COPY
+    (--execute), which skips SQL parsing entirely.
+
+    Child tables whose rows carry natural keys instead of parent ids set
+    source — the row columns as (name, type) — and select, which maps the
+    relation {source} (aliased s) onto cols, e.g. by joining animals.
+    Source columns are rendered with their type's SQL_LITERAL helper, so
+    they must not hold None.
+
+    labels names the low-cardinality text columns (of source, or of cols for
+    plain blocks); they render through the memoized q_label and must hold
+    str values.
+    """
+    table: str
+    cols: tuple[str, ...]
+    rows: list[tuple]
+    batch_size: int = DEFAULT_BATCH_SIZE
+    source: tuple[tuple[str, str], ...] = ()
+    select: str = ""
+    labels: frozenset[str] = frozenset()
+
+    def _values(self) -> list[str]:
+        """Render column by column with map() (C-level loops), then zip the
+        rendered columns back into "(...)" tuples."""
+        if self.select:
+            fmts = [(name, SQL_LITERAL[typ]) for name, typ in self.source]
+        else:
+            fmts = [(name, q) for name in self.cols]
+        rendered = [
+            map(q_label if name in self.labels else fmt, col)
+            for (name, fmt), col in zip(fmts, zip(*self.rows))
+        ]
+        return ["(" + ", ".join(r) + ")" for r in zip(*rendered)]
+
+    def to_sql(self) -> list[str]:
+        values = self._values()
+        if not self.select:
+            return insert_rows(self.table, ", ".join(self.cols), values, self.batch_size)
+        names = ", ".join(name for name, _ in self.source)
+        return insert_join_rows(
+            self.table, ", ".join(self.cols),
+            self.select.format(source="(VALUES\n  {values}\n) AS s (" + names + ")"),
+            values, self.batch_size,
+        )
 
-def pool_subq(herd_id: str) -> str:
-    return f"(SELECT pool_id FROM token_pools WHERE herd_id = {q(herd_id)} LIMIT 1)"
+    def copy_into(self, cur) -> None:
+        """COPY the rows in; joined blocks go through a temp stage table."""
+        buf = io.StringIO()
+        buf.writelines(",".join(map(csv_field, r)) + "\n" for r in self.rows)
+        buf.seek(0)
+        if not self.select:
+            cur.copy_expert(
+                f"COPY {self.table} ({', '.join(self.cols)}) FROM STDIN WITH (FORMAT csv)", buf
+            )
+            return
+        stage = f"stage_{self.table}"
+        cur.execute(
+            f"CREATE TEMP TABLE {stage} ("
+            + ", ".join(f"{name} {typ}" for name, typ in self.source)
+            + ") ON COMMIT DROP"
+        )
+        cur.copy_expert(f"COPY {stage} FROM STDIN WITH (FORMAT csv)", buf)
+        cur.execute(
+            f"INSERT INTO {self.table} ({', '.join(self.cols)})\n"
+            + self.select.format(source=f"{stage} AS s")
+        )
+
+
+def csv_field(v) -> str:
+    """
+    One COPY csv field. None stays an unquoted empty field, which COPY reads
+    as NULL; every str is quoted, so '' loads as an empty string just as
+    q_str renders it in the SQL output (csv.QUOTE_NOTNULL before 3.12).
+    """
+    if v is None:
+        return ""
+    if isinstance(v, str):
+        return '"' + v.replace('"', '""') + '"'
+    return str(v)
+
+
+# A seed section is either ready-made statements or a RowBlock of raw rows
+Section = Union[list[str], RowBlock]
+
+
+def pool_uid(herd_id: str) -> str:
+    """token_pools.pool_id for a herd — key-derived, so children can inline it."""
+    return uid(f"pool:{herd_id}")
 
 
 # ---------------------------------------------------------------------------
@@ -208,7 +367,7 @@ VETS = [
 # Data classes
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class User:
     user_id: str
     role: str
@@ -217,7 +376,7 @@ class User:
     wallet_address: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Herd:
     herd_id: str
     rancher_id: str
@@ -231,10 +390,11 @@ class Herd:
     feedlot_status: str = "pending"          # 'pending' | 'listed'
     investor_pct: Optional[float] = None     # % of tokens available to investors
     feedlot_slug: Optional[str] = None       # slug of feedlot user who claimed this herd
+    feedlot_user_id: Optional[str] = None    # that feedlot user's user_id
     projected_roi_annual: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Animal:
     registration_number: str
     official_id: str
@@ -247,6 +407,11 @@ class Animal:
     is_genomic_enhanced: bool
     herd_id: str
     stage: str
+    # Pre-built SQL fragment, computed once instead of per generated row
+    reg_sql: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.reg_sql = q_str(self.registration_number)
 
 
 # ---------------------------------------------------------------------------
@@ -255,26 +420,34 @@ class Animal:
 
 def build_users() -> list[User]:
     users: list[User] = []
-    users.append(User(uid(), "admin",    "admin@cattleplatform.io",    "admin",    None))
+    users.append(User(uid("user:admin"), "admin",    "admin@cattleplatform.io",    "admin",    None))
     for i in range(1, 6):
-        users.append(User(uid(), "rancher",  f"rancher{i}@platform.io",   f"rancher{i}",
+        users.append(User(uid(f"user:rancher{i}"), "rancher",  f"rancher{i}@platform.io",   f"rancher{i}",
                           f"0x{'%020x' % (i,)}"))
     for i in range(1, 6):
-        users.append(User(uid(), "investor", f"investor{i}@platform.io",  f"investor{i}",
+        users.append(User(uid(f"user:investor{i}"), "investor", f"investor{i}@platform.io",  f"investor{i}",
                           f"0x{'%020x' % (i,)}"))
     for i in range(1, 4):
-        users.append(User(uid(), "feedlot",  f"feedlot{i}@cattlecoin.dev", f"feedlot{i}",
+        users.append(User(uid(f"user:feedlot{i}"), "feedlot",  f"feedlot{i}@cattlecoin.dev", f"feedlot{i}",
                           None))
     return users
 
 
+def users_by_role(users: list[User]) -> dict[str, list[User]]:
+    """Group users by role once, in build order, for the role lookups downstream."""
+    by_role: dict[str, list[User]] = {}
+    for u in users:
+        by_role.setdefault(u.role, []).append(u)
+    return by_role
+
+
 # ---------------------------------------------------------------------------
 # Build herds
 # ---------------------------------------------------------------------------
 
-def build_herds(users: list[User]) -> list[Herd]:
-    ranchers  = [u for u in users if u.role == "rancher"]
-    feedlots  = [u for u in users if u.role == "feedlot"]
+def build_herds(by_role: dict[str, list[User]]) -> list[Herd]:
+    ranchers  = by_role["rancher"]
+    feedlot_ids = {u.slug: u.user_id for u in by_role["feedlot"]}
 
     # Columns:
     # (rancher_idx, name, breed, head, purchase_status, verified, stage,
@@ -308,7 +481,7 @@ def build_herds(users: list[User]) -> list[Herd]:
     for rancher_idx, name, breed, head, status, verified, stage, feedlot_slug, investor_pct in specs:
         is_listed = feedlot_slug is not None
         herds.append(Herd(
-            herd_id=uid(),
+            herd_id=uid(f"herd:{name}"),
             rancher_id=ranchers[rancher_idx].user_id,
             herd_name=name,
             breed_code=breed,
@@ -320,6 +493,7 @@ def build_herds(users: list[User]) -> list[Herd]:
             feedlot_status="listed" if is_listed else "pending",
             investor_pct=float(investor_pct) if investor_pct is not None else None,
             feedlot_slug=feedlot_slug,
+            feedlot_user_id=feedlot_ids[feedlot_slug] if is_listed else None,
         ))
     return herds
 
@@ -328,34 +502,47 @@ def build_herds(users: list[User]) -> list[Herd]:
 # Build animals
 # ---------------------------------------------------------------------------
 
-_EID_COUNTER = [840_003_100_000_000]
+# First of the sequential 15-digit official EIDs (840 = USA country code)
+EID_START = 840_003_100_000_001
 
 
-def _next_eid() -> str:
-    _EID_COUNTER[0] += 1
-    return str(_EID_COUNTER[0])
+def _take_eids(eid_iter: itertools.count, n: int) -> list[str]:
+    """Next n EIDs as strings, pulled and converted in one C-level pass."""
+    return list(map(str, itertools.islice(eid_iter, n)))
 
 
 def build_animals(herds: list[Herd]) -> list[Animal]:
+    """
+    Animals come out contiguous per herd, in herd order. Breed and stage
+    are per-herd, so the list is already grouped by (herd, breed, stage)
+    for the generator passes without a separate sort.
+    """
     animals: list[Animal] = []
+    today = date.today()
+    # Fresh per call, so repeated builds in one process number EIDs alike
+    eid_iter = itertools.count(EID_START)
     for herd in herds:
         age_min, age_max = STAGE_AGE_DAYS[herd.stage]
         genomic_rate = (0.90 if herd.breed_code == "WAG"
                         else 0.65 if herd.breed_code in ("AN", "SIM")
                         else 0.35)
-        for n in range(1, herd.head_count + 1):
-            age_days = random.randint(age_min, age_max)
-            birth = days_ago(age_days)
-            roll = random.random()
-            sex = "C" if roll < 0.78 else ("H" if roll < 0.92 else "B")
-            is_genomic = random.random() < genomic_rate
-            herd_short = herd.herd_id[-6:].upper()
+        herd_short = herd.herd_id[-6:].upper()
+        prefix = "".join(w[0] for w in herd.herd_name.split()[:3]).upper()
+        # Per-herd columns: birth dates and sex codes are derived array-wide
+        # (datetime64 subtraction, np.select) before the per-animal loop.
+        ages = NP_RNG.integers(age_min, age_max + 1, herd.head_count)
+        births = (np.datetime64(today, "D") - ages).tolist()
+        sex_rolls = NP_RNG.random(herd.head_count)
+        sexes = np.select([sex_rolls < 0.78, sex_rolls < 0.92], ["C", "H"], "B").tolist()
+        genomic = (NP_RNG.random(herd.head_count) < genomic_rate).tolist()
+        eids = _take_eids(eid_iter, herd.head_count)
+        for n, birth, sex, is_genomic in zip(
+                range(1, herd.head_count + 1), births, sexes, genomic):
             reg = f"{herd.breed_code}-{birth.year}-{herd_short}-{n:03d}"
-            prefix = "".join(w[0] for w in herd.herd_name.split()[:3]).upper()
             name = f"{prefix} {n:03d}"
             animals.append(Animal(
                 registration_number=reg,
-                official_id=_next_eid(),
+                official_id=eids[n - 1],
                 animal_name=name,
                 breed_code=herd.breed_code,
                 sex_code=sex,
@@ -374,61 +561,53 @@ def build_animals(herds: list[Herd]) -> list[Animal]:
 # ---------------------------------------------------------------------------
 
 def gen_users(users: list[User]) -> list[str]:
-    out = []
-    for u in users:
-        out.append(
-            f"INSERT INTO users (user_id, role, email, password_hash, wallet_address, slug) VALUES "
-            f"({q(u.user_id)}, {q(u.role)}::user_role, {q(u.email)}, "
-            f"{q('$2b$12$placeholder_hash')}, {q(u.wallet_address)}, {q(u.slug)});"
-        )
-    return out
+    rows = [
+        f"({q(u.user_id)}, {q(u.role)}::user_role, {q(u.email)}, "
+        f"{q('$2b$12$placeholder_hash')}, {q(u.wallet_address)}, {q(u.slug)})"
+        for u in users
+    ]
+    return insert_rows("users", "user_id, role, email, password_hash, wallet_address, slug", rows)
 
 
 def gen_herds(herds: list[Herd]) -> list[str]:
-    out = []
+    rows = []
     for h in herds:
-        # feedlot_user_id is resolved via subquery against the slug
-        if h.feedlot_slug is not None:
-            feedlot_uid = f"(SELECT user_id FROM users WHERE slug = {q(h.feedlot_slug)} LIMIT 1)"
-        else:
-            feedlot_uid = "NULL"
         inv_pct = str(h.investor_pct) if h.investor_pct is not None else "NULL"
-        out.append(
-            "INSERT INTO herds "
-            "(herd_id, rancher_id, herd_name, head_count, listing_price, purchase_status, "
-            "verified_flag, feedlot_status, investor_pct, feedlot_user_id) VALUES "
+        rows.append(
             f"({q(h.herd_id)}, {q(h.rancher_id)}, {q(h.herd_name)}, "
             f"{h.head_count}, {h.listing_price}, {q(h.purchase_status)}, {q(h.verified_flag)}, "
-            f"{q(h.feedlot_status)}, {inv_pct}, {feedlot_uid});"
+            f"{q(h.feedlot_status)}, {inv_pct}, {q(h.feedlot_user_id)})"
         )
-    return out
+    return insert_rows(
+        "herds",
+        "herd_id, rancher_id, herd_name, head_count, listing_price, purchase_status, "
+        "verified_flag, feedlot_status, investor_pct, feedlot_user_id",
+        rows,
+    )
 
 
-def gen_animals(animals: list[Animal]) -> list[str]:
-    out = []
-    for a in animals:
-        out.append(
-            f"INSERT INTO animals "
-            f"(registration_number, official_id, animal_name, breed_code, sex_code, "
-            f"birth_date, sire_registration_number, dam_registration_number, "
-            f"is_genomic_enhanced, herd_id) VALUES "
-            f"({q(a.registration_number)}, {q(a.official_id)}, {q(a.animal_name)}, "
-            f"{q(a.breed_code)}, {q(a.sex_code)}, {q(str(a.birth_date))}, "
-            f"{q(a.sire_reg)}, {q(a.dam_reg)}, "
-            f"{q(a.is_genomic_enhanced)}, {q(a.herd_id)});"
-        )
-    return out
+def gen_animals(animals: list[Animal], batch_size: int = DEFAULT_BATCH_SIZE) -> RowBlock:
+    rows = [
+        (a.registration_number, a.official_id, a.animal_name, a.breed_code, a.sex_code,
+         a.birth_date, a.sire_reg, a.dam_reg, a.is_genomic_enhanced, a.herd_id)
+        for a in animals
+    ]
+    return RowBlock(
+        "animals",
+        ("registration_number", "official_id", "animal_name", "breed_code", "sex_code",
+         "birth_date", "sire_registration_number", "dam_registration_number",
+         "is_genomic_enhanced", "herd_id"),
+        rows, batch_size,
+        labels=frozenset({"breed_code", "sex_code", "herd_id"}),
+    )
 
 
 def gen_token_pools(herds: list[Herd]) -> list[str]:
-    out = []
-    for h in herds:
-        supply = h.head_count * 1000
-        out.append(
-            f"INSERT INTO token_pools (pool_id, herd_id, total_supply, contract_address) VALUES "
-            f"({q(uid())}, {q(h.herd_id)}, {supply}, NULL);"
-        )
-    return out
+    rows = [
+        f"({q(pool_uid(h.herd_id))}, {q(h.herd_id)}, {h.head_count * 1000}, NULL)"
+        for h in herds
+    ]
+    return insert_rows("token_pools", "pool_id, herd_id, total_supply, contract_address", rows)
 
 
 def gen_epd_traits() -> list[str]:
@@ -449,14 +628,15 @@ def gen_epd_traits() -> list[str]:
         ("TI",   "Terminal Index",          "index",        "$",      "Dollar-value index optimised for terminal sire scenarios",                         True),
         ("BMI",  "Beef Market Index",       "index",        "$",      "Composite dollar-value index for overall beef merit",                              True),
     ]
-    out = []
-    for code, name, cat, unit, desc, is_idx in traits:
-        out.append(
-            f"INSERT INTO epd_traits (trait_code, trait_name, trait_category, unit_of_measure, description, is_index) "
-            f"VALUES ({q(code)}, {q(name)}, {q(cat)}, {q(unit)}, {q(desc)}, {q(is_idx)}) "
-            f"ON CONFLICT (trait_code) DO NOTHING;"
-        )
-    return out
+    rows = [
+        f"({q(code)}, {q(name)}, {q(cat)}, {q(unit)}, {q(desc)}, {q(is_idx)})"
+        for code, name, cat, unit, desc, is_idx in traits
+    ]
+    return insert_rows(
+        "epd_traits",
+        "trait_code, trait_name, trait_category, unit_of_measure, description, is_index",
+        rows, suffix="\nON CONFLICT (trait_code) DO NOTHING",
+    )
 
 
 EPD_RUNS: list[tuple] = [
@@ -469,15 +649,15 @@ EPD_RUNS: list[tuple] = [
     ("BN",  "International Brangus Breeders Assoc EPD",   "2024-07-01", "IBBA-2024-JUL"),
 ]
 
+RUN_DATE_BY_BREED: dict[str, date] = {r[0]: date.fromisoformat(r[2]) for r in EPD_RUNS}
+
 
 def gen_epd_runs() -> list[str]:
-    out = []
-    for breed, source, eval_date, batch_id in EPD_RUNS:
-        out.append(
-            f"INSERT INTO epd_runs (breed_code, source_system, evaluation_date, import_batch_id) VALUES "
-            f"({q(breed)}, {q(source)}, {q(eval_date)}, {q(batch_id)});"
-        )
-    return out
+    rows = [
+        f"({q(breed)}, {q(source)}, {q(eval_date)}, {q(batch_id)})"
+        for breed, source, eval_date, batch_id in EPD_RUNS
+    ]
+    return insert_rows("epd_runs", "breed_code, source_system, evaluation_date, import_batch_id", rows)
 
 
 VACCINES: list[tuple] = [
@@ -495,13 +675,8 @@ VACCINES: list[tuple] = [
 
 
 def gen_vaccines() -> list[str]:
-    out = []
-    for name, mfr, vtype in VACCINES:
-        out.append(
-            f"INSERT INTO vaccines (vaccine_name, manufacturer, vaccine_type) VALUES "
-            f"({q(name)}, {q(mfr)}, {q(vtype)});"
-        )
-    return out
+    rows = [f"({q(name)}, {q(mfr)}, {q(vtype)})" for name, mfr, vtype in VACCINES]
+    return insert_rows("vaccines", "vaccine_name, manufacturer, vaccine_type", rows)
 
 
 HEALTH_PROGRAMS: list[tuple] = [
@@ -521,13 +696,10 @@ HEALTH_PROGRAMS: list[tuple] = [
 
 
 def gen_health_programs() -> list[str]:
-    out = []
-    for name, desc, body in HEALTH_PROGRAMS:
-        out.append(
-            f"INSERT INTO health_programs (program_name, program_description, certifying_body, active_flag) VALUES "
-            f"({q(name)}, {q(desc)}, {q(body)}, TRUE);"
-        )
-    return out
+    rows = [f"({q(name)}, {q(desc)}, {q(body)}, TRUE)" for name, desc, body in HEALTH_PROGRAMS]
+    return insert_rows(
+        "health_programs", "program_name, program_description, certifying_body, active_flag", rows
+    )
 
 
 VALUE_ADD_PROGRAMS: list[tuple] = [
@@ -541,16 +713,21 @@ VALUE_ADD_PROGRAMS: list[tuple] = [
 
 
 def gen_value_add_programs() -> list[str]:
-    out = []
-    for name, ptype, body, desc in VALUE_ADD_PROGRAMS:
-        out.append(
-            f"INSERT INTO value_add_programs (program_name, program_type, certifying_body, description, active_flag) VALUES "
-            f"({q(name)}, {q(ptype)}, {q(body)}, {q(desc)}, TRUE);"
-        )
-    return out
+    rows = [
+        f"({q(name)}, {q(ptype)}, {q(body)}, {q(desc)}, TRUE)"
+        for name, ptype, body, desc in VALUE_ADD_PROGRAMS
+    ]
+    return insert_rows(
+        "value_add_programs",
+        "program_name, program_type, certifying_body, description, active_flag",
+        rows,
+    )
 
 
-def gen_animal_weights(animals: list[Animal]) -> tuple[list[str], dict[str, float]]:
+def gen_animal_weights(
+    animals: list[Animal],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> tuple[RowBlock, dict[str, float]]:
     weight_events: dict[str, list[tuple]] = {
         "ranch":         [("weaning",           350,  600,  45)],
         "backgrounding": [("stocker_intake",     540,  720,  60),
@@ -561,29 +738,48 @@ def gen_animal_weights(animals: list[Animal]) -> tuple[list[str], dict[str, floa
         "processing":    [("harvest_weight",    1200, 1430,   7)],
         "distribution":  [("harvest_weight",    1200, 1430,  14)],
     }
-    out: list[str] = []
+    rows: list[tuple] = []
     latest_weights: dict[str, float] = {}
 
+    # Flatten every weigh-in into one plan so each random variable is a
+    # single vectorized draw: (animal, weight_type, low_lb, high_lb, days_back)
+    plan: list[tuple[Animal, str, float, float, int]] = []
     for a in animals:
         cfg = BREEDS[a.breed_code]
         scale = (cfg[3] + cfg[4]) / 2 / 1300
-        events = weight_events.get(a.stage, [("weaning", 350, 600, 45)])
-        facility = random.choice(FACILITIES.get(a.stage, FACILITIES["ranch"]))
-        last_weight = None
-        for wtype, lb_min, lb_max, days_back in events:
-            lb = round(random.uniform(lb_min * scale, lb_max * scale), 1)
-            wdate = days_ago(days_back + random.randint(0, 10))
-            last_weight = lb
-            out.append(
-                "INSERT INTO animal_weights (animal_id, weight_date, weight_lbs, weight_type, location_code) "
-                f"VALUES ({animal_subq(a.registration_number)}, {q(str(wdate))}, {lb}, {q(wtype)}, {q(facility)});"
-            )
-        if last_weight is not None:
-            latest_weights[a.registration_number] = last_weight
-    return out, latest_weights
+        for wtype, lb_min, lb_max, days_back in weight_events.get(a.stage, weight_events["ranch"]):
+            plan.append((a, wtype, lb_min * scale, lb_max * scale, days_back))
+
+    # One facility per animal: a single draw with per-animal upper bounds
+    pools = [FACILITIES.get(a.stage, FACILITIES["ranch"]) for a in animals]
+    picks = NP_RNG.integers(0, [len(p) for p in pools]).tolist()
+    facility = {
+        a.registration_number: pool[i] for a, pool, i in zip(animals, pools, picks)
+    }
+    lbs = np.round(NP_RNG.uniform([p[2] for p in plan], [p[3] for p in plan]), 1).tolist()
+    jitter = NP_RNG.integers(0, 11, len(plan)).tolist()
+    today = date.today()
+
+    for (a, wtype, _, _, days_back), lb, extra_days in zip(plan, lbs, jitter):
+        reg = a.registration_number
+        rows.append((reg, days_ago(days_back + extra_days, today), lb, wtype, facility[reg]))
+        # Events are listed chronologically, so the last one written wins
+        latest_weights[reg] = lb
+    block = RowBlock(
+        "animal_weights",
+        ("animal_id", "weight_date", "weight_lbs", "weight_type", "location_code"),
+        rows, batch_size,
+        source=(("registration_number", "text"), ("weight_date", "date"),
+                ("weight_lbs", "numeric"), ("weight_type", "text"), ("location_code", "text")),
+        select="SELECT a.animal_id, s.weight_date, s.weight_lbs, s.weight_type, s.location_code\n"
+               "FROM {source}\n"
+               "JOIN animals a USING (registration_number)",
+        labels=frozenset({"weight_type", "location_code"}),
+    )
+    return block, latest_weights
 
 
-def gen_animal_vaccinations(animals: list[Animal]) -> list[str]:
+def gen_animal_vaccinations(animals: list[Animal], batch_size: int = DEFAULT_BATCH_SIZE) -> RowBlock:
     protocols: dict[str, list[tuple]] = {
         "feedlot": [
             (1, "2 mL",       "SQ",      False,  0),
@@ -609,27 +805,51 @@ def gen_animal_vaccinations(animals: list[Animal]) -> list[str]:
         "processing":   [],
         "distribution": [],
     }
-    out = []
-    for a in animals:
-        protocol = protocols["wagyu_nhtc"] if a.breed_code == "WAG" else protocols.get(a.stage, protocols["ranch"])
+    heifer_steps = [(9, "5 mL", "SQ", False, 0)]
+
+    # Resolve each protocol step's vaccine sequence to its name once:
+    # (day_offset, vaccine_name, dose, route, booster_flag)
+    def compile_steps(steps: list[tuple]) -> list[tuple]:
+        return [
+            (day_offset, VACCINES[vacc_seq - 1][0], dose, route, is_booster)
+            for vacc_seq, dose, route, is_booster, day_offset in steps
+        ]
+    compiled = {name: compile_steps(steps) for name, steps in protocols.items()}
+    heifer_extra = compile_steps(heifer_steps)
+
+    rows: list[tuple] = []
+    n = len(animals)
+    arrival_days = NP_RNG.integers(30, 181, n).tolist()
+    vet_picks = NP_RNG.integers(0, len(VETS), n).tolist()
+    lot_numbers = NP_RNG.integers(1000, 10000, n).tolist()
+    today = date.today()
+    for a, arrival_ago, vet_i, lot_no in zip(animals, arrival_days, vet_picks, lot_numbers):
+        protocol = compiled["wagyu_nhtc"] if a.breed_code == "WAG" else compiled.get(a.stage, compiled["ranch"])
         if a.sex_code == "H":
-            protocol = list(protocol) + [(9, "5 mL", "SQ", False, 0)]
-        arrival = days_ago(random.randint(30, 180))
-        vet = random.choice(VETS)
-        lot = f"LOT{random.randint(1000, 9999)}"
-        for vacc_seq, dose, route, is_booster, day_offset in protocol:
-            admin_date = arrival + timedelta(days=day_offset)
-            vacc_subq = (
-                f"(SELECT vaccine_id FROM vaccines "
-                f"WHERE vaccine_name = {q(VACCINES[vacc_seq - 1][0])} LIMIT 1)"
-            )
-            out.append(
-                f"INSERT INTO animal_vaccinations "
-                f"(animal_id, vaccine_id, administration_date, dose, route, administered_by, lot_number, booster_flag) "
-                f"VALUES ({animal_subq(a.registration_number)}, {vacc_subq}, "
-                f"{q(str(admin_date))}, {q(dose)}, {q(route)}, {q(vet)}, {q(lot)}, {q(is_booster)});"
-            )
-    return out
+            protocol = protocol + heifer_extra
+        arrival = days_ago(arrival_ago, today)
+        vet = VETS[vet_i]
+        lot = f"LOT{lot_no}"
+        for day_offset, vacc_name, dose, route, is_booster in protocol:
+            rows.append((a.registration_number, vacc_name, arrival + timedelta(days=day_offset),
+                         dose, route, vet, lot, is_booster))
+    # vaccine_name isn't unique in the schema, so join one id per name
+    return RowBlock(
+        "animal_vaccinations",
+        ("animal_id", "vaccine_id", "administration_date", "dose", "route",
+         "administered_by", "lot_number", "booster_flag"),
+        rows, batch_size,
+        source=(("registration_number", "text"), ("vaccine_name", "text"),
+                ("administration_date", "date"), ("dose", "text"), ("route", "text"),
+                ("administered_by", "text"), ("lot_number", "text"), ("booster_flag", "boolean")),
+        select="SELECT a.animal_id, v.vaccine_id, s.administration_date, s.dose, s.route, "
+               "s.administered_by, s.lot_number, s.booster_flag\n"
+               "FROM {source}\n"
+               "JOIN animals a USING (registration_number)\n"
+               "JOIN (SELECT vaccine_name, MIN(vaccine_id) AS vaccine_id FROM vaccines "
+               "GROUP BY vaccine_name) v USING (vaccine_name)",
+        labels=frozenset({"vaccine_name", "dose", "route", "administered_by"}),
+    )
 
 
 BREED_EPD_PARAMS: dict[str, dict[str, tuple[float, float]]] = {
@@ -654,36 +874,63 @@ BREED_EPD_PARAMS: dict[str, dict[str, tuple[float, float]]] = {
 }
 
 
-def gen_animal_epds(animals: list[Animal]) -> tuple[list[str], dict[str, float]]:
-    out: list[str] = []
+def _epd_param_matrices() -> tuple[list[str], dict[str, int], np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Dense (breed × trait) views of BREED_EPD_PARAMS so every EPD value can be
+    drawn in one NumPy call. The mask marks the traits each breed reports.
+    """
+    traits = list(dict.fromkeys(t for params in BREED_EPD_PARAMS.values() for t in params))
+    breed_idx = {breed: i for i, breed in enumerate(BREED_EPD_PARAMS)}
+    mean = np.zeros((len(breed_idx), len(traits)))
+    std = np.zeros_like(mean)
+    mask = np.zeros(mean.shape, dtype=bool)
+    for breed, params in BREED_EPD_PARAMS.items():
+        for trait, (m, sd) in params.items():
+            i, j = breed_idx[breed], traits.index(trait)
+            mean[i, j], std[i, j], mask[i, j] = m, sd, True
+    return traits, breed_idx, mean, std, mask
+
+
+EPD_TRAITS, EPD_BREED_IDX, EPD_MEAN, EPD_STD, EPD_MASK = _epd_param_matrices()
+
+
+def gen_animal_epds(
+    animals: list[Animal],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> tuple[RowBlock, dict[str, float]]:
+    rows: list[tuple] = []
     rep_percentiles: dict[str, float] = {}
-    for a in animals:
-        if not a.is_genomic_enhanced and random.random() > 0.25:
-            continue
-        params = BREED_EPD_PARAMS.get(a.breed_code, {})
-        if not params:
-            continue
-        run_eval_date = next((r[2] for r in EPD_RUNS if r[0] == a.breed_code), None)
+
+    # Genomic animals always report EPDs; others a 25% sample
+    rolls = NP_RNG.random(len(animals)).tolist()
+    selected = [
+        a for a, roll in zip(animals, rolls)
+        if (a.is_genomic_enhanced or roll <= 0.25) and a.breed_code in EPD_BREED_IDX
+    ]
+
+    # Whole (animal × trait) grids in one draw each; masked-out cells are unused
+    breed_rows = [EPD_BREED_IDX[a.breed_code] for a in selected]
+    epd_grid = np.round(NP_RNG.normal(EPD_MEAN[breed_rows], EPD_STD[breed_rows]), 4).tolist()
+    acc_base = np.array([0.75 if a.is_genomic_enhanced else 0.42 for a in selected])
+    acc_grid = np.round(
+        np.clip(NP_RNG.normal(acc_base[:, None], 0.06, (len(selected), len(EPD_TRAITS))), 0.20, 0.99),
+        4,
+    ).tolist()
+    pct_grid = np.clip(
+        np.trunc(NP_RNG.normal(60, 15, (len(selected), len(EPD_TRAITS)))), 5, 95
+    ).astype(int).tolist()
+    trait_cols = [np.flatnonzero(row).tolist() for row in EPD_MASK]
+
+    for a, b, epd_vals, accs, pcts in zip(selected, breed_rows, epd_grid, acc_grid, pct_grid):
+        run_eval_date = RUN_DATE_BY_BREED.get(a.breed_code)
         if not run_eval_date:
             continue
-        run_subq = (
-            f"(SELECT epd_run_id FROM epd_runs "
-            f"WHERE breed_code = {q(a.breed_code)} "
-            f"AND evaluation_date = {q(run_eval_date)} LIMIT 1)"
-        )
-        acc_base = 0.75 if a.is_genomic_enhanced else 0.42
         trait_percentiles: list[tuple[str, int]] = []
-        for trait_code, (mean, std) in params.items():
-            epd_val = round(random.gauss(mean, std), 4)
-            accuracy = round(min(0.99, max(0.20, random.gauss(acc_base, 0.06))), 4)
-            pct_rank = max(5, min(95, int(random.gauss(60, 15))))
-            trait_percentiles.append((trait_code, pct_rank))
-            out.append(
-                "INSERT INTO animal_epds "
-                "(animal_id, epd_run_id, trait_code, epd_value, accuracy, percentile_rank, interim_flag) "
-                f"VALUES ({animal_subq(a.registration_number)}, {run_subq}, "
-                f"{q(trait_code)}, {epd_val}, {accuracy}, {pct_rank}, FALSE);"
-            )
+        for j in trait_cols[b]:
+            pct_rank = pcts[j]
+            trait_percentiles.append((EPD_TRAITS[j], pct_rank))
+            rows.append((a.registration_number, a.breed_code, run_eval_date,
+                         EPD_TRAITS[j], epd_vals[j], accs[j], pct_rank))
         if not trait_percentiles:
             continue
         marb_pct = next((p for t, p in trait_percentiles if t == "MARB"), None)
@@ -691,85 +938,122 @@ def gen_animal_epds(animals: list[Animal]) -> tuple[list[str], dict[str, float]]
             float(marb_pct) if marb_pct is not None
             else sum(p for _, p in trait_percentiles) / len(trait_percentiles)
         )
-    return out, rep_percentiles
+    # Runs are keyed by (breed_code, evaluation_date); join one id per key
+    block = RowBlock(
+        "animal_epds",
+        ("animal_id", "epd_run_id", "trait_code", "epd_value", "accuracy",
+         "percentile_rank", "interim_flag"),
+        rows, batch_size,
+        source=(("registration_number", "text"), ("breed_code", "text"),
+                ("evaluation_date", "date"), ("trait_code", "text"), ("epd_value", "numeric"),
+                ("accuracy", "numeric"), ("percentile_rank", "integer")),
+        select="SELECT a.animal_id, r.epd_run_id, s.trait_code, s.epd_value, s.accuracy, "
+               "s.percentile_rank, FALSE\n"
+               "FROM {source}\n"
+               "JOIN animals a USING (registration_number)\n"
+               "JOIN (SELECT breed_code, evaluation_date, MIN(epd_run_id) AS epd_run_id "
+               "FROM epd_runs GROUP BY breed_code, evaluation_date) r\n"
+               "  ON r.breed_code = s.breed_code AND r.evaluation_date = s.evaluation_date",
+        labels=frozenset({"breed_code", "trait_code"}),
+    )
+    return block, rep_percentiles
+
 
+# Program name + enrollment/expiration literals are the same for every animal
+# in an enrollment, so render them once here rather than per row.
+def _enrollment_sql(program_name: str, enroll: date, expire: date) -> str:
+    return f"{q_str(program_name)}, {q_date(enroll)}, {q_date(expire)}"
 
-def gen_animal_health_programs(animals: list[Animal], herds: list[Herd]) -> list[str]:
-    herd_map = {h.herd_id: h for h in herds}
-    out = []
+
+BQA_2024_SQL  = _enrollment_sql("Beef Quality Assurance (BQA)", date(2024, 1, 1), date(2025, 1, 1))
+PVP_2024_SQL  = _enrollment_sql("USDA Process Verified Program (PVP)", date(2024, 3, 15), date(2025, 3, 15))
+NHTC_2022_SQL = _enrollment_sql("Non-Hormone Treated Cattle (NHTC)", date(2022, 1, 1), date(2027, 1, 1))
+VN_2022_SQL   = _enrollment_sql("Verified Natural (VN)", date(2022, 1, 1), date(2027, 1, 1))
+EU_2022_SQL   = _enrollment_sql("Export Eligible — EU Verified", date(2022, 6, 1), date(2027, 6, 1))
+GAP1_2023_SQL = _enrollment_sql("Global Animal Partnership Step 1", date(2023, 5, 1), date(2025, 5, 1))
+AGW_2023_SQL  = _enrollment_sql("Certified Grassfed by AGW", date(2023, 6, 1), date(2025, 6, 1))
+VN_2024_SQL   = _enrollment_sql("Verified Natural (VN)", date(2024, 2, 1), date(2026, 2, 1))
+
+
+def gen_animal_health_programs(
+    animals: list[Animal],
+    herd_map: dict[str, Herd],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> list[str]:
+    rows = []
     for a in animals:
         herd = herd_map[a.herd_id]
         enrollments = []
         if herd.verified_flag:
-            enrollments.append((
-                "Beef Quality Assurance (BQA)",
-                date(2024, 1, 1), date(2025, 1, 1),
-                f"BQA24-{a.registration_number[-12:]}"
-            ))
+            enrollments.append((BQA_2024_SQL, f"BQA24-{a.registration_number[-12:]}"))
         if a.breed_code == "WAG" or (a.breed_code == "AN" and herd.verified_flag):
-            enrollments.append((
-                "USDA Process Verified Program (PVP)",
-                date(2024, 3, 15), date(2025, 3, 15),
-                f"PVP24-{a.registration_number[-12:]}"
-            ))
-        for prog_name, enroll, expire, cert in enrollments:
-            prog_subq = (
-                f"(SELECT health_program_id FROM health_programs "
-                f"WHERE program_name = {q(prog_name)} LIMIT 1)"
-            )
-            out.append(
-                f"INSERT INTO animal_health_programs "
-                f"(animal_id, health_program_id, enrollment_date, expiration_date, "
-                f"certification_number, verified_flag) "
-                f"VALUES ({animal_subq(a.registration_number)}, {prog_subq}, "
-                f"{q(str(enroll))}, {q(str(expire))}, {q(cert)}, TRUE);"
-            )
-    return out
+            enrollments.append((PVP_2024_SQL, f"PVP24-{a.registration_number[-12:]}"))
+        for program_sql, cert in enrollments:
+            rows.append(f"({a.reg_sql}, {program_sql}, {q_str(cert)})")
+    return insert_join_rows(
+        "animal_health_programs",
+        "animal_id, health_program_id, enrollment_date, expiration_date, "
+        "certification_number, verified_flag",
+        "SELECT a.animal_id, p.health_program_id, s.enrollment_date, "
+        "s.expiration_date, s.certification_number, TRUE\n"
+        "FROM (VALUES\n  {values}\n"
+        ") AS s (registration_number, program_name, enrollment_date, expiration_date, "
+        "certification_number)\n"
+        "JOIN animals a USING (registration_number)\n"
+        "JOIN (SELECT program_name, MIN(health_program_id) AS health_program_id "
+        "FROM health_programs GROUP BY program_name) p USING (program_name)",
+        rows, batch_size,
+    )
 
 
 def gen_animal_value_add_programs(
     animals: list[Animal],
-    herds: list[Herd],
+    herd_map: dict[str, Herd],
+    batch_size: int = DEFAULT_BATCH_SIZE,
 ) -> tuple[list[str], dict[str, int]]:
-    herd_map = {h.herd_id: h for h in herds}
-    out: list[str] = []
+    rows: list[str] = []
     counts: dict[str, int] = {}
     for a in animals:
         herd = herd_map[a.herd_id]
         enrollments = []
         if a.breed_code == "WAG":
             enrollments += [
-                ("Non-Hormone Treated Cattle (NHTC)", date(2022, 1, 1), date(2027, 1, 1), f"NHTC-{a.registration_number[-12:]}"),
-                ("Verified Natural (VN)",              date(2022, 1, 1), date(2027, 1, 1), f"VN-{a.registration_number[-14:]}"),
-                ("Export Eligible — EU Verified",      date(2022, 6, 1), date(2027, 6, 1), f"EU-{a.registration_number[-15:]}"),
+                (NHTC_2022_SQL, f"NHTC-{a.registration_number[-12:]}"),
+                (VN_2022_SQL,   f"VN-{a.registration_number[-14:]}"),
+                (EU_2022_SQL,   f"EU-{a.registration_number[-15:]}"),
             ]
         elif "Grassfed" in herd.herd_name:
             enrollments += [
-                ("Global Animal Partnership Step 1", date(2023, 5, 1), date(2025, 5, 1), f"GAP1-{a.registration_number[-11:]}"),
-                ("Certified Grassfed by AGW",        date(2023, 6, 1), date(2025, 6, 1), f"AGW-{a.registration_number[-12:]}"),
+                (GAP1_2023_SQL, f"GAP1-{a.registration_number[-11:]}"),
+                (AGW_2023_SQL,  f"AGW-{a.registration_number[-12:]}"),
             ]
         elif a.breed_code == "AN" and herd.verified_flag:
-            enrollments.append(
-                ("Verified Natural (VN)", date(2024, 2, 1), date(2026, 2, 1), f"VN-{a.registration_number[-14:]}")
-            )
+            enrollments.append((VN_2024_SQL, f"VN-{a.registration_number[-14:]}"))
         counts[a.registration_number] = len(enrollments)
-        for prog_name, enroll, expire, cert in enrollments:
-            prog_subq = (
-                f"(SELECT value_add_program_id FROM value_add_programs "
-                f"WHERE program_name = {q(prog_name)} LIMIT 1)"
-            )
-            out.append(
-                "INSERT INTO animal_value_add_programs "
-                "(animal_id, value_add_program_id, enrollment_date, expiration_date, "
-                "certification_number, verified_flag) "
-                f"VALUES ({animal_subq(a.registration_number)}, {prog_subq}, "
-                f"{q(str(enroll))}, {q(str(expire))}, {q(cert)}, TRUE);"
-            )
+        for program_sql, cert in enrollments:
+            rows.append(f"({a.reg_sql}, {program_sql}, {q_str(cert)})")
+    out = insert_join_rows(
+        "animal_value_add_programs",
+        "animal_id, value_add_program_id, enrollment_date, expiration_date, "
+        "certification_number, verified_flag",
+        "SELECT a.animal_id, p.value_add_program_id, s.enrollment_date, "
+        "s.expiration_date, s.certification_number, TRUE\n"
+        "FROM (VALUES\n  {values}\n"
+        ") AS s (registration_number, program_name, enrollment_date, expiration_date, "
+        "certification_number)\n"
+        "JOIN animals a USING (registration_number)\n"
+        "JOIN (SELECT program_name, MIN(value_add_program_id) AS value_add_program_id "
+        "FROM value_add_programs GROUP BY program_name) p USING (program_name)",
+        rows, batch_size,
+    )
     return out, counts
 
 
-def gen_cow_health(animals: list[Animal], herds: list[Herd]) -> list[str]:
-    herd_map = {h.herd_id: h for h in herds}
+def gen_cow_health(
+    animals: list[Animal],
+    herd_map: dict[str, Herd],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> RowBlock:
     stage_vacc = {
         "feedlot":       "Vista Once SQ + One Shot Ultra 7 (BQA Arrival Protocol)",
         "backgrounding": "Bovi-Shield Gold FP 5 L5 + Vision 7 SPUR (Pre-Conditioning)",
@@ -784,165 +1068,172 @@ def gen_cow_health(animals: list[Animal], herds: list[Herd]) -> list[str]:
         "processing":    "USDA Process Verified Program (PVP)",
         "distribution":  "USDA Process Verified Program (PVP)",
     }
-    out = []
-    for a in animals:
+    rows: list[tuple] = []
+    # All administration dates in one draw: 14–120 days before today
+    admin_dates = (
+        np.datetime64(date.today(), "D")
+        - NP_RNG.integers(14, 121, size=len(animals)).astype("timedelta64[D]")
+    ).tolist()
+    for a, admin_date in zip(animals, admin_dates):
         herd = herd_map[a.herd_id]
-        vacc_name = stage_vacc.get(a.stage, stage_vacc["ranch"])
-        prog_name = stage_prog.get(a.stage, stage_prog["ranch"])
-        admin_date = days_ago(random.randint(14, 120))
-        cert = f"HLTH-{a.registration_number[-16:]}"
-        out.append(
-            f"INSERT INTO cow_health "
-            f"(cow_id, vaccine_name, administration_date, health_program_name, "
-            f"certification_number, verified_flag) "
-            f"VALUES ({animal_subq(a.registration_number)}, {q(vacc_name)}, "
-            f"{q(str(admin_date))}, {q(prog_name)}, {q(cert)}, {q(herd.verified_flag)});"
-        )
-    return out
+        rows.append((
+            a.registration_number,
+            stage_vacc.get(a.stage, stage_vacc["ranch"]),
+            admin_date,
+            stage_prog.get(a.stage, stage_prog["ranch"]),
+            f"HLTH-{a.registration_number[-16:]}",
+            herd.verified_flag,
+        ))
+    return RowBlock(
+        "cow_health",
+        ("cow_id", "vaccine_name", "administration_date", "health_program_name",
+         "certification_number", "verified_flag"),
+        rows, batch_size,
+        source=(("registration_number", "text"), ("vaccine_name", "text"),
+                ("administration_date", "date"), ("health_program_name", "text"),
+                ("certification_number", "text"), ("verified_flag", "boolean")),
+        select="SELECT a.animal_id, s.vaccine_name, s.administration_date, "
+               "s.health_program_name, s.certification_number, s.verified_flag\n"
+               "FROM {source}\n"
+               "JOIN animals a USING (registration_number)",
+        labels=frozenset({"vaccine_name", "health_program_name"}),
+    )
 
 
 # ── CowValuation ──────────────────────────────────────────────────────────────
 
 def gen_cow_valuations(
     animals: list[Animal],
-    herds: list[Herd],
+    herd_map: dict[str, Herd],
     latest_weights: dict[str, float],       # ← correct param name
     cert_program_counts: dict[str, int],
     epd_percentiles: dict[str, float],
-) -> tuple[list[str], dict[str, float]]:
-    herd_map = {h.herd_id: h for h in herds}
-    out: list[str] = []
-    value_map: dict[str, float] = {}
-
-    for a in animals:
-        herd = herd_map[a.herd_id]
-        cfg = BREEDS[a.breed_code]
-        harvest_mid = (cfg[3] + cfg[4]) / 2
-
-        percentile    = epd_percentiles.get(a.registration_number)
-        weight_lbs    = latest_weights.get(a.registration_number)       # ← fixed
-        num_certs     = cert_program_counts.get(a.registration_number, 0)
-        base_price    = _stage_base_price(a.stage, a.breed_code, weight_lbs, cfg)
-
-        metrics = AnimalMetrics(
-            breed_code=a.breed_code,
-            stage=a.stage,
-            is_genomic_enhanced=a.is_genomic_enhanced,
-            percentile_rank=percentile,
-            current_weight_lbs=weight_lbs,
-            harvest_weight_mid_lbs=harvest_mid,
-            base_price_usd=base_price,
-            num_cert_programs=num_certs,
-            days_on_feed=random.uniform(120, 200) if a.stage in ("feedlot", "backgrounding") else None,
-            fcr_score=random.uniform(5.0, 7.5) if a.stage == "feedlot" else None,
-            usrsb_score=random.uniform(55.0, 90.0),
-        )
-
-        # Compute the four scores
-        genetics_score     = calculate_genetics_score(percentile, a.is_genomic_enhanced, RNG)
-        health_score       = calculate_health_score(
-                                 herd.verified_flag,
-                                 weight_lbs,
-                                 a.stage,
-                                 harvest_mid,
-                                 RNG,
-                             )
-        sustainability_score = calculate_sustainability_score(
-                                   metrics.days_on_feed,
-                                   metrics.fcr_score,
-                                   metrics.usrsb_score,
-                                   RNG,
-                               )
-        cert_score         = calculate_certification_score(num_certs)
-
-        # Compute the three multipliers (stored for audit)
-        gp  = grade_premium(genetics_score)
-        qm  = quality_multiplier(health_score, cert_score)
-        sm  = sustainability_multiplier(sustainability_score)
-
-        # Fair value and listing value
-        fair_val    = round(base_price * gp * qm * sm, 2)
-        listing_val = round(fair_val * 0.90, 2)
-
-        value_map[a.registration_number] = listing_val
-
-        method = f"v3.1-{a.breed_code.lower()}-{a.stage}"
-
-        out.append(
-            "INSERT INTO cow_valuation "
-            "(cow_id, genetics_score, health_score, sustainability_score, certification_score, "
-            "grade_premium, quality_mult, sustainability_mult, "
-            "base_price_usd, fair_value, listing_value, valuation_method_version) "
-            f"VALUES ({animal_subq(a.registration_number)}, "
-            f"{genetics_score}, {health_score}, {sustainability_score}, {cert_score}, "
-            f"{gp}, {qm}, {sm}, "
-            f"{base_price}, {fair_val}, {listing_val}, {q(method)});"
-        )
-
-    return out, value_map
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> tuple[RowBlock, dict[str, float]]:
+    # Struct-of-arrays inputs: one pass over the animals for the lookups,
+    # then every score and multiplier is computed over whole arrays
+    n = len(animals)
+    nan = float("nan")
+    regs        = [a.registration_number for a in animals]
+    weights     = [latest_weights.get(r) for r in regs]
+    harvest_mid = [(BREEDS[a.breed_code][3] + BREEDS[a.breed_code][4]) / 2 for a in animals]
+    stages      = np.array([a.stage for a in animals])
+
+    # Sustainability inputs in three draws; stages that don't use a value
+    # get NaN (the scalar path's None)
+    dof   = NP_RNG.uniform(120, 200, n)
+    fcr   = NP_RNG.uniform(5.0, 7.5, n)
+    usrsb = NP_RNG.uniform(55.0, 90.0, n)
+
+    metrics = AnimalMetricsArrays(
+        stage_idx=np.array([STAGE_INDEX.get(a.stage, len(STAGE_INDEX)) for a in animals],
+                            dtype=np.intp),
+        is_genomic_enhanced=np.array([a.is_genomic_enhanced for a in animals], dtype=bool),
+        verified_herd=np.array([herd_map[a.herd_id].verified_flag for a in animals], dtype=bool),
+        percentile_rank=np.array([epd_percentiles.get(r, nan) for r in regs], dtype=float),
+        current_weight_lbs=np.array([nan if w is None else w for w in weights], dtype=float),
+        harvest_weight_mid_lbs=np.array(harvest_mid, dtype=float),
+        base_price_usd=np.array([
+            _stage_base_price(a.stage, a.breed_code, w, BREEDS[a.breed_code])
+            for a, w in zip(animals, weights)
+        ], dtype=float),
+        num_cert_programs=np.array([cert_program_counts.get(r, 0) for r in regs], dtype=int),
+        days_on_feed=np.where(np.isin(stages, ("feedlot", "backgrounding")), dof, nan),
+        fcr_score=np.where(stages == "feedlot", fcr, nan),
+        usrsb_score=usrsb,
+    )
+    scores = calculate_valuations(metrics, NP_RNG)
+
+    val_cols = ("genetics_score", "health_score", "sustainability_score", "certification_score",
+                "grade_premium", "quality_mult", "sustainability_mult",
+                "base_price_usd", "fair_value", "listing_value")
+    scores["base_price_usd"] = metrics.base_price_usd
+    methods = [f"v3.1-{a.breed_code.lower()}-{a.stage}" for a in animals]
+    rows = list(zip(regs, *(scores[c].tolist() for c in val_cols), methods))
+    value_map = dict(zip(regs, scores["listing_value"].tolist()))
+
+    block = RowBlock(
+        "cow_valuation",
+        ("cow_id",) + val_cols + ("valuation_method_version",),
+        rows, batch_size,
+        source=(("registration_number", "text"),)
+               + tuple((c, "numeric") for c in val_cols)
+               + (("valuation_method_version", "text"),),
+        select="SELECT a.animal_id, " + ", ".join(f"s.{c}" for c in val_cols)
+               + ", s.valuation_method_version\n"
+               "FROM {source}\n"
+               "JOIN animals a USING (registration_number)",
+        labels=frozenset({"valuation_method_version"}),
+    )
+    return block, value_map
 
 
-def gen_ownership(users: list[User], herds: list[Herd]) -> list[str]:
-    investors = [u for u in users if u.role == "investor"]
-    out: list[str] = []
-    for h in herds:
-        # Pending herds have NOT been listed to investors yet — no ownership.
-        if h.feedlot_status == "pending":
-            continue
-
+def gen_ownership(
+    investors: list[User],
+    herds: list[Herd],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> list[str]:
+    # Pending herds have NOT been listed to investors yet — no ownership.
+    listed = [h for h in herds if h.feedlot_status != "pending"]
+    sold_pcts = NP_RNG.uniform(0.20, 0.65, size=len(listed)).round(2).tolist()
+
+    pools: list[tuple[Herd, int]] = []
+    for h, sold_pct in zip(listed, sold_pcts):
         total = h.head_count * 1000
         # Investors can only purchase up to investor_allocation tokens
         investor_allocation = int(total * h.investor_pct / 100.0) if h.investor_pct is not None else total
         if investor_allocation < 1:
             continue
-
-        pool_sq = pool_subq(h.herd_id)
-
         if h.purchase_status == "sold":
             sold_pct = 1.0
-        else:
-            sold_pct = round(random.uniform(0.20, 0.65), 2)
-
-        tokens_to_assign = max(1, int(investor_allocation * sold_pct))
-
-        # Cap n_inv so we always have enough tokens to split
-        max_inv = min(3, len(investors), tokens_to_assign)
-        n_inv = random.randint(1, max(1, max_inv))
-        selected = random.sample(investors, n_inv)
-
-        if n_inv == 1 or tokens_to_assign < n_inv:
-            splits = [tokens_to_assign]
-            selected = selected[:1]
-        else:
-            cuts = sorted(random.sample(range(1, tokens_to_assign), n_inv - 1))
-            splits = [cuts[0]] + [cuts[i] - cuts[i-1] for i in range(1, len(cuts))] + [tokens_to_assign - cuts[-1]]
-
-        for inv, amount in zip(selected, splits):
+        pools.append((h, max(1, int(investor_allocation * sold_pct))))
+
+    # Cap n_inv so we always have enough tokens to split; one draw for all pools
+    tokens = np.array([t for _, t in pools], dtype=np.int64)
+    max_inv = np.maximum(1, np.minimum(min(3, len(investors)), tokens))
+    n_invs = NP_RNG.integers(1, max_inv + 1).tolist()
+
+    rows: list[str] = []
+    for (h, tokens_to_assign), n_inv in zip(pools, n_invs):
+        pool_sql = q_str(pool_uid(h.herd_id))
+        selected = NP_RNG.choice(len(investors), n_inv, replace=False).tolist()
+        # Dirichlet(1, ..., 1) weights + multinomial: a uniform random
+        # partition of tokens_to_assign into n_inv counts
+        splits = NP_RNG.multinomial(tokens_to_assign, NP_RNG.dirichlet(np.ones(n_inv))).tolist()
+        for i, amount in zip(selected, splits):
             if amount < 1:
                 continue
-            out.append(
-                "INSERT INTO ownership (user_id, pool_id, token_amount) "
-                f"VALUES ({q(inv.user_id)}, {pool_sq}, {amount}) "
-                "ON CONFLICT (user_id, pool_id) DO UPDATE "
-                "SET token_amount = ownership.token_amount + EXCLUDED.token_amount;"
-            )
-    return out
+            rows.append(f"({q_str(investors[i].user_id)}, {pool_sql}, {amount})")
+    # choice(replace=False) picks distinct investors per pool, so no (user, pool)
+    # pair repeats within a statement — required by ON CONFLICT DO UPDATE
+    return insert_rows(
+        "ownership", "user_id, pool_id, token_amount", rows, batch_size,
+        suffix="\nON CONFLICT (user_id, pool_id) DO UPDATE "
+               "SET token_amount = ownership.token_amount + EXCLUDED.token_amount",
+    )
 
 
-def gen_transactions(users: list[User], herds: list[Herd]) -> list[str]:
-    admin = next(u for u in users if u.role == "admin")
-    investors = [u for u in users if u.role == "investor"]
-    out = []
-    for h in herds:
+def gen_transactions(
+    admin: User,
+    investors: list[User],
+    herds: list[Herd],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> RowBlock:
+    rows: list[tuple] = []
+    # Per-herd noise drawn up front: buy_pct, buy count, up to 3 buy-amount
+    # fractions and 4 investor picks (3 buys + 1 redeem)
+    n_herds = len(herds)
+    buy_pcts  = NP_RNG.uniform(0.20, 0.60, n_herds).round(2).tolist()
+    n_buys    = NP_RNG.integers(1, 4, n_herds).tolist()
+    buy_fracs = NP_RNG.random((n_herds, 3)).tolist()
+    inv_picks = NP_RNG.integers(0, len(investors), (n_herds, 4)).tolist()
+
+    for h, buy_pct, n_buy, fracs, picks in zip(herds, buy_pcts, n_buys, buy_fracs, inv_picks):
         total = float(h.head_count * 1000)
-        pool_sq = pool_subq(h.herd_id)
+        pool_id = pool_uid(h.herd_id)
 
         # Mint transaction records for all herds (token pool creation)
-        out.append(
-            "INSERT INTO transactions (user_id, pool_id, type, amount, status, blockchain_tx_hash) "
-            f"VALUES ({q(admin.user_id)}, {pool_sq}, 'mint'::transaction_type, "
-            f"{total}, 'confirmed', NULL);"
-        )
+        rows.append((admin.user_id, pool_id, "mint", total, "confirmed", None))
 
         # Pending herds have no investor buy/redeem transactions yet
         if h.feedlot_status == "pending":
@@ -952,28 +1243,22 @@ def gen_transactions(users: list[User], herds: list[Herd]) -> list[str]:
 
         if h.purchase_status == "sold":
             buy_pct = 1.0
-        else:
-            buy_pct = round(random.uniform(0.20, 0.60), 2)
-
-        for _ in range(random.randint(1, 3)):
-            inv = random.choice(investors)
-            amount = round(random.uniform(investor_allocation * 0.05, investor_allocation * buy_pct * 0.5), 6)
-            amount = max(1.0, amount)
-            out.append(
-                "INSERT INTO transactions (user_id, pool_id, type, amount, status, blockchain_tx_hash) "
-                f"VALUES ({q(inv.user_id)}, {pool_sq}, 'buy'::transaction_type, "
-                f"{amount}, 'confirmed', NULL);"
-            )
+
+        lo = investor_allocation * 0.05
+        hi = investor_allocation * buy_pct * 0.5
+        for frac, pick in zip(fracs[:n_buy], picks):
+            amount = max(1.0, round(lo + (hi - lo) * frac, 6))
+            rows.append((investors[pick].user_id, pool_id, "buy", amount, "confirmed", None))
 
         if h.purchase_status == "sold":
-            inv = random.choice(investors)
-            out.append(
-                "INSERT INTO transactions (user_id, pool_id, type, amount, status, blockchain_tx_hash) "
-                f"VALUES ({q(inv.user_id)}, {pool_sq}, 'redeem'::transaction_type, "
-                f"{investor_allocation}, 'confirmed', NULL);"
-            )
+            rows.append((investors[picks[3]].user_id, pool_id, "redeem", investor_allocation, "confirmed", None))
 
-    return out
+    return RowBlock(
+        "transactions",
+        ("user_id", "pool_id", "type", "amount", "status", "blockchain_tx_hash"),
+        rows, batch_size,
+        labels=frozenset({"user_id", "pool_id", "type", "status"}),
+    )
 
 
 
@@ -981,13 +1266,27 @@ def gen_transactions(users: list[User], herds: list[Herd]) -> list[str]:
 # Assemble full SQL document
 # ---------------------------------------------------------------------------
 
-def build_sql() -> str:
-    random.seed(42)
+def build_sections(batch_size: int = DEFAULT_BATCH_SIZE) -> tuple[list[tuple[str, Section]], int, int]:
+    """
+    Generate every seed section in FK-dependency order.
+    Returns (sections, animal_count, herd_count).
+
+    Generators run sequentially on purpose: they draw from the one seeded
+    NP_RNG stream, so their call order defines the output.
+    """
+    global NP_RNG
+    NP_RNG = np.random.default_rng(42)
 
     users   = build_users()
-    herds   = build_herds(users)
+    by_role = users_by_role(users)
+    herds   = build_herds(by_role)
     animals = build_animals(herds)
 
+    # Lookups shared by several generators, built once
+    herd_map  = {h.herd_id: h for h in herds}
+    admin     = by_role["admin"][0]
+    investors = by_role["investor"]
+
     epd_traits_sql        = gen_epd_traits()
     epd_runs_sql          = gen_epd_runs()
     vaccines_sql          = gen_vaccines()
@@ -995,33 +1294,36 @@ def build_sql() -> str:
     value_add_programs_sql = gen_value_add_programs()
     users_sql             = gen_users(users)
     token_pools_sql       = gen_token_pools(herds)
-    animals_sql           = gen_animals(animals)
+    animals_sql           = gen_animals(animals, batch_size)
 
-    animal_weights_sql, latest_weights   = gen_animal_weights(animals)
-    animal_vaccinations_sql              = gen_animal_vaccinations(animals)
-    animal_epds_sql, epd_percentiles     = gen_animal_epds(animals)
-    animal_health_programs_sql           = gen_animal_health_programs(animals, herds)
-    animal_value_add_sql, cert_counts    = gen_animal_value_add_programs(animals, herds)
-    cow_health_sql                       = gen_cow_health(animals, herds)
+    animal_weights_sql, latest_weights   = gen_animal_weights(animals, batch_size)
+    animal_vaccinations_sql              = gen_animal_vaccinations(animals, batch_size)
+    animal_epds_sql, epd_percentiles     = gen_animal_epds(animals, batch_size)
+    animal_health_programs_sql           = gen_animal_health_programs(animals, herd_map, batch_size)
+    animal_value_add_sql, cert_counts    = gen_animal_value_add_programs(animals, herd_map, batch_size)
+    cow_health_sql                       = gen_cow_health(animals, herd_map, batch_size)
 
     cow_valuations_sql, value_map = gen_cow_valuations(
-        animals, herds, latest_weights, cert_counts, epd_percentiles
+        animals, herd_map, latest_weights, cert_counts, epd_percentiles, batch_size
     )
 
-    # Derive listing_price per herd from per-cow listing values
-    for h in herds:
-        per_cow = {
-            reg: val
-            for reg, val in value_map.items()
-            if any(a.registration_number == reg and a.herd_id == h.herd_id for a in animals)
-        }
-        h.listing_price = derive_listing_price_from_valuations(h.stage, per_cow)
+    # listing_price per herd = sum of its per-cow listing values
+    # (derive_listing_price_from_valuations), for all herds in one bincount
+    herd_pos = {h.herd_id: i for i, h in enumerate(herds)}
+    valued = [a for a in animals if a.registration_number in value_map]
+    herd_totals = np.bincount(
+        [herd_pos[a.herd_id] for a in valued],
+        weights=[value_map[a.registration_number] for a in valued],
+        minlength=len(herds),
+    ).tolist()
+    for h, total in zip(herds, herd_totals):
+        h.listing_price = round(total, 2)
 
     herds_sql       = gen_herds(herds)
-    ownership_sql   = gen_ownership(users, herds)
-    transactions_sql = gen_transactions(users, herds)
+    ownership_sql   = gen_ownership(investors, herds, batch_size)
+    transactions_sql = gen_transactions(admin, investors, herds, batch_size)
 
-    sections: list[tuple[str, list[str]]] = [
+    sections: list[tuple[str, Section]] = [
         ("REFERENCE DATA — EPD TRAITS",              epd_traits_sql),
         ("REFERENCE DATA — EPD RUNS",                epd_runs_sql),
         ("REFERENCE DATA — VACCINES",                vaccines_sql),
@@ -1041,12 +1343,21 @@ def build_sql() -> str:
         ("OWNERSHIP",                                ownership_sql),
         ("TRANSACTIONS",                             transactions_sql),
     ]
+    return sections, len(animals), len(herds)
+
+
+def stream_sql(out: TextIO, batch_size: int = DEFAULT_BATCH_SIZE) -> None:
+    """
+    Write the seed SQL to out statement by statement, so the whole document
+    is never materialised as one string.
+    """
+    sections, n_animals, n_herds = build_sections(batch_size)
 
-    lines = [
+    header = [
         "-- ===========================================================================",
         "-- Cattle Platform — Seed Data",
         f"-- Generated : {date.today()}",
-        f"-- Animals   : {len(animals)} across {len(herds)} herds",
+        f"-- Animals   : {n_animals} across {n_herds} herds",
         "-- RNG seed  : 42 (fully reproducible)",
         "-- Valuation : v3.1 — base_price_usd × GP(G) × QM(H,C) × SM(S) × 0.90 discount",
         "-- ===========================================================================",
@@ -1054,15 +1365,20 @@ def build_sql() -> str:
         "BEGIN;",
         "",
     ]
+    out.write("\n".join(header) + "\n")
 
     for title, stmts in sections:
+        if isinstance(stmts, RowBlock):
+            stmts = stmts.to_sql()
         if not stmts:
             continue
-        lines.append(f"-- ── {title} {'─' * max(0, 72 - len(title))}")
-        lines.extend(stmts)
-        lines.append("")
+        out.write(f"-- ── {title} {'─' * max(0, 72 - len(title))}\n")
+        for stmt in stmts:
+            out.write(stmt)
+            out.write("\n")
+        out.write("\n")
 
-    lines += [
+    footer = [
         "COMMIT;",
         "",
         "-- ── SANITY CHECKS (uncomment to run after seeding) ─────────────────────────",
@@ -1080,14 +1396,30 @@ def build_sql() -> str:
         "-- SELECT u.email, SUM(o.token_amount) AS tokens",
         "--   FROM ownership o JOIN users u ON u.user_id = o.user_id GROUP BY 1 ORDER BY 2 DESC;",
     ]
+    out.write("\n".join(footer) + "\n")
+
 
-    return "\n".join(lines)
+def build_sql(batch_size: int = DEFAULT_BATCH_SIZE) -> str:
+    buf = io.StringIO()
+    stream_sql(buf, batch_size)
+    return buf.getvalue()
 
 
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
 
+def _positive_int(value: str) -> int:
+    """argparse type for --batch-size: an integer of at least 1."""
+    try:
+        n = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}") from None
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Generate or execute cattle platform seed data.")
     parser.add_argument("--execute",  action="store_true")
@@ -1097,26 +1429,35 @@ def main() -> None:
     parser.add_argument("--user",     default="postgres")
     parser.add_argument("--password", default="")
     parser.add_argument("--output",   default=None)
+    parser.add_argument("--batch-size", default=DEFAULT_BATCH_SIZE, type=_positive_int,
+                        help="rows per multi-row INSERT for the bulk tables")
     args = parser.parse_args()
 
-    sql = build_sql()
-
     if args.output:
         with open(args.output, "w") as f:
-            f.write(sql)
+            stream_sql(f, args.batch_size)
         print(f"SQL written to {args.output}")
     elif args.execute:
         try:
             import psycopg2
         except ImportError:
             raise SystemExit("Run: pip install psycopg2-binary")
+        # Generate before connecting, so a generation failure leaves no
+        # connection open
+        sections, _, _ = build_sections(args.batch_size)
         conn = psycopg2.connect(
             host=args.host, port=args.port, dbname=args.dbname,
             user=args.user, password=args.password,
         )
         try:
+            # One transaction; RowBlock sections go through COPY, the rest
+            # are executed as generated.
             with conn.cursor() as cur:
-                cur.execute(sql)
+                for _, stmts in sections:
+                    if isinstance(stmts, RowBlock):
+                        stmts.copy_into(cur)
+                    elif stmts:
+                        cur.execute("\n".join(stmts))
             conn.commit()
             print("Seed committed successfully.")
         except Exception as exc:
@@ -1126,7 +1467,7 @@ def main() -> None:
         finally:
             conn.close()
     else:
-        print(sql)
+        stream_sql(sys.stdout, args.batch_size)
 
 
 if __name__ == "__main__":
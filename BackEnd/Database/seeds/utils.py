@@ -1,29 +1,11 @@
 from __future__ import annotations
 
-import random
+import math
 from dataclasses import dataclass
-from typing import Optional, Dict
+from statistics import NormalDist
+from typing import Dict
 
-@dataclass
-class AnimalMetrics:
-    """
-    Per-animal inputs for the valuation engine.
-
-    base_price_usd: Real USDA/AMS market value for this animal at its
-                    current stage (weight × $/cwt). Updated at each
-                    stage transition; scores stay locked.
-    """
-    breed_code: str
-    stage: str
-    is_genomic_enhanced: bool
-    percentile_rank: Optional[float]
-    current_weight_lbs: Optional[float]
-    harvest_weight_mid_lbs: float
-    base_price_usd: float        # replaces price_per_lb — stage-anchored $/head
-    num_cert_programs: int
-    days_on_feed: Optional[float] = None   # for sustainability FCR proxy
-    fcr_score: Optional[float] = None     # feed conversion ratio (lower = better)
-    usrsb_score: Optional[float] = None   # 0-100 USRSB indicator score
+import numpy as np
 
 
 # Stage → (completion_fraction, years_to_harvest)
@@ -45,12 +27,60 @@ STAGE_TARGET_ROI = {
 }
 
 
-def _truncated_normal(mean: float, std_dev: float, low: float, high: float,
-                      rng: random.Random) -> float:
-    while True:
-        x = rng.gauss(mean, std_dev)
-        if low <= x <= high:
-            return x
+# Stage → position in STAGE_COMPLETION; unknown stages map to the trailing
+# fallback entry of _COMPLETION_TARGETS
+STAGE_INDEX = {stage: i for i, stage in enumerate(STAGE_COMPLETION)}
+_COMPLETION_TARGETS = np.array([c for c, _ in STAGE_COMPLETION.values()] + [0.70])
+
+
+# The scoring functions below take NumPy arrays (one entry per animal, NaN
+# where an input is missing) or plain scalars, and draw their noise from a
+# numpy.random.Generator.
+
+_STD_NORMAL = NormalDist()
+_SQRT2 = math.sqrt(2.0)
+
+
+def _std_normal_cdf(z: float) -> float:
+    """Φ(z) via erfc, which keeps its precision deep in the lower tail."""
+    return 0.5 * math.erfc(-z / _SQRT2)
+
+
+def _truncated_normal_ppf(u: float, mean: float, std_dev: float,
+                          low: float, high: float) -> float:
+    """
+    Map a uniform u in [0, 1) to N(mean, std_dev) truncated to [low, high]
+    by inverse CDF. A band above the mean is reflected into the lower tail,
+    where Φ doesn't saturate, so far-off bands still land near their edge
+    closest to the mean.
+    """
+    a = (low - mean) / std_dev
+    b = (high - mean) / std_dev
+    sign = 1.0
+    if a > 0.0:
+        a, b, sign = -b, -a, -1.0
+    lo = _std_normal_cdf(a)
+    p = lo + u * (_std_normal_cdf(b) - lo)
+    # Both tails underflowed: all the mass sits at the edge nearest the mean
+    z = _STD_NORMAL.inv_cdf(p) if 0.0 < p < 1.0 else b
+    return min(high, max(low, mean + sign * std_dev * z))
+
+
+# Applies _truncated_normal_ppf per element (a Python call each, not SIMD)
+_truncated_normal_ppf_ufunc = np.frompyfunc(_truncated_normal_ppf, 5, 1)
+
+
+def _truncated_normal(mean: np.ndarray, std_dev: float, low: float, high: float,
+                      rng: np.random.Generator) -> np.ndarray:
+    """
+    Inverse-CDF sample of N(mean, std_dev) truncated to [low, high] for each
+    element of mean: one uniform draw per element mapped through the normal
+    quantile, so the cost stays bounded even when a mean sits far outside
+    the band.
+    """
+    mean = np.asarray(mean, dtype=float)
+    u = rng.random(mean.shape)
+    return np.asarray(_truncated_normal_ppf_ufunc(u, mean, std_dev, low, high), dtype=float)
 
 
 # ─────────────────────────────────────────────
@@ -58,31 +88,27 @@ def _truncated_normal(mean: float, std_dev: float, low: float, high: float,
 # ─────────────────────────────────────────────
 
 def calculate_genetics_score(
-    percentile_rank: Optional[float],
-    is_genomic_enhanced: bool,
-    rng: Optional[random.Random] = None,
-) -> float:
+    percentile_rank: np.ndarray,
+    is_genomic_enhanced: np.ndarray,
+    rng: np.random.Generator,
+) -> np.ndarray:
     """
     Genetics score 0-100 from EPD composite percentile.
-    p=50 anchors near 55; genomic +6 pts.
+    p=50 anchors near 55; genomic +6 pts; missing percentile counts as 60.
     Skewed upward — listed animals start at ~60+.
     """
-    if rng is None:
-        rng = random
-    p = max(0.0, min(100.0, percentile_rank or 60.0))
-    base = 55.0 + 0.45 * (p - 50.0)
-    if is_genomic_enhanced:
-        base += 6.0
-    return round(_truncated_normal(base, 3.0, 40.0, 99.0, rng), 4)
+    p = np.clip(np.nan_to_num(percentile_rank, nan=60.0), 0.0, 100.0)
+    base = 55.0 + 0.45 * (p - 50.0) + np.where(is_genomic_enhanced, 6.0, 0.0)
+    return np.round(_truncated_normal(base, 3.0, 40.0, 99.0, rng), 4)
 
 
-def grade_premium(genetics_score: float) -> float:
+def grade_premium(genetics_score: np.ndarray) -> np.ndarray:
     """
     GP(G) = 1 + 0.10 × (G − 50) / 50, clipped to [0.95, 1.10].
     Better EPDs → higher Prime/Choice share → grid value premium.
     """
     gp = 1.0 + 0.10 * (genetics_score - 50.0) / 50.0
-    return round(max(0.95, min(1.10, gp)), 6)
+    return np.round(np.clip(gp, 0.95, 1.10), 6)
 
 
 # ─────────────────────────────────────────────
@@ -90,38 +116,36 @@ def grade_premium(genetics_score: float) -> float:
 # ─────────────────────────────────────────────
 
 def calculate_health_score(
-    verified_herd: bool,
-    current_weight_lbs: Optional[float],
-    stage: str,
-    harvest_weight_mid_lbs: float,
-    rng: Optional[random.Random] = None,
-) -> float:
+    verified_herd: np.ndarray,
+    current_weight_lbs: np.ndarray,
+    stage_idx: np.ndarray,
+    harvest_weight_mid_lbs: np.ndarray,
+    rng: np.random.Generator,
+) -> np.ndarray:
     """
     Health & Weight score 0-100.
     60% health component (verified herd status, BQA, treatment history).
     40% weight component (current weight vs stage benchmark).
     Professor's note: weight must be included in health score.
+    stage_idx comes from STAGE_INDEX (len(STAGE_INDEX) for an unknown stage).
     """
-    if rng is None:
-        rng = random
-
     # 60% health
-    health_base = 92.0 if verified_herd else 78.0
+    health_base = np.where(verified_herd, 92.0, 78.0)
     health_component = _truncated_normal(health_base, 4.0, 55.0, 99.0, rng)
 
     # 40% weight: how close is current weight to stage target?
-    completion_target, _ = STAGE_COMPLETION.get(stage, (0.70, 0.50))
-    if current_weight_lbs and harvest_weight_mid_lbs > 0:
-        ideal = completion_target * harvest_weight_mid_lbs
-        ratio = current_weight_lbs / ideal
-        ratio = max(0.80, min(1.10, ratio))
-        weight_component = 60.0 + 40.0 * (ratio - 1.0) / 0.10
-        weight_component = max(55.0, min(99.0, weight_component))
-    else:
-        weight_component = 72.0   # neutral fallback
+    weight = np.nan_to_num(current_weight_lbs)
+    has_weight = (weight > 0) & (harvest_weight_mid_lbs > 0)
+    ideal = np.where(has_weight, _COMPLETION_TARGETS[stage_idx] * harvest_weight_mid_lbs, 1.0)
+    ratio = np.clip(weight / ideal, 0.80, 1.10)
+    weight_component = np.where(
+        has_weight,
+        np.clip(60.0 + 40.0 * (ratio - 1.0) / 0.10, 55.0, 99.0),
+        72.0,     # neutral fallback
+    )
 
     combined = 0.60 * health_component + 0.40 * weight_component
-    return round(max(40.0, min(99.0, combined)), 4)
+    return np.round(np.clip(combined, 40.0, 99.0), 4)
 
 
 # ─────────────────────────────────────────────
@@ -129,11 +153,11 @@ def calculate_health_score(
 # ─────────────────────────────────────────────
 
 def calculate_sustainability_score(
-    days_on_feed: Optional[float],
-    fcr_score: Optional[float],
-    usrsb_score: Optional[float],
-    rng: Optional[random.Random] = None,
-) -> float:
+    days_on_feed: np.ndarray,
+    fcr_score: np.ndarray,
+    usrsb_score: np.ndarray,
+    rng: np.random.Generator,
+) -> np.ndarray:
     """
     Sustainability score 0-100, two equal halves:
 
@@ -144,62 +168,53 @@ def calculate_sustainability_score(
     USRSB (50%): land, water, animal welfare indicators (0-100 input).
         - Reference: USRSB standard indicator set.
 
-    If inputs are missing, use conservative defaults.
+    If inputs are missing (NaN), use conservative defaults.
     """
-    if rng is None:
-        rng = random
-
     # Planet sub-score (0-100): lower DOF and FCR = higher score
-    if days_on_feed is not None:
-        # Benchmark: 160 DOF = good, >220 = poor
-        planet_dof = max(0.0, min(100.0, 100.0 - (days_on_feed - 120.0) / 1.0))
-    else:
-        planet_dof = 65.0
-
-    if fcr_score is not None:
-        # FCR 5.0 = excellent (score 90), 8.0 = poor (score 50)
-        planet_fcr = max(0.0, min(100.0, 90.0 - (fcr_score - 5.0) * 13.3))
-    else:
-        planet_fcr = 65.0
+    # Benchmark: 160 DOF = good, >220 = poor
+    planet_dof = np.where(np.isnan(days_on_feed), 65.0,
+                          np.clip(100.0 - (days_on_feed - 120.0) / 1.0, 0.0, 100.0))
+    # FCR 5.0 = excellent (score 90), 8.0 = poor (score 50)
+    planet_fcr = np.where(np.isnan(fcr_score), 65.0,
+                          np.clip(90.0 - (fcr_score - 5.0) * 13.3, 0.0, 100.0))
 
     planet_sub = 0.5 * planet_dof + 0.5 * planet_fcr
 
     # USRSB sub-score (0-100 direct input)
-    usrsb = usrsb_score if usrsb_score is not None else 65.0
-    usrsb = max(0.0, min(100.0, usrsb))
+    usrsb = np.clip(np.nan_to_num(usrsb_score, nan=65.0), 0.0, 100.0)
 
     combined = 0.50 * planet_sub + 0.50 * usrsb
-    return round(_truncated_normal(combined, 3.0, 40.0, 99.0, rng), 4)
+    return np.round(_truncated_normal(combined, 3.0, 40.0, 99.0, rng), 4)
 
 
-def sustainability_multiplier(sustainability_score: float) -> float:
+def sustainability_multiplier(sustainability_score: np.ndarray) -> np.ndarray:
     """
     SM(S) = 0.92 + 0.20 × S/100, range [0.92, 1.12].
     """
-    return round(0.92 + 0.20 * (sustainability_score / 100.0), 6)
+    return np.round(0.92 + 0.20 * (sustainability_score / 100.0), 6)
 
 
 # ─────────────────────────────────────────────
 # SCORE 4: Certifications
 # ─────────────────────────────────────────────
 
-def calculate_certification_score(num_programs: int) -> float:
+def calculate_certification_score(num_programs: np.ndarray) -> np.ndarray:
     """
     +18 pts per verified program (NHTC, GAP, Verified Natural, etc.), cap 100.
     """
-    return round(min(100.0, 18.0 * max(0, num_programs)), 4)
+    return np.round(np.minimum(100.0, 18.0 * np.maximum(0, num_programs)), 4)
 
 
 # ─────────────────────────────────────────────
 # COMBINED Quality Multiplier QM(H, C)
 # ─────────────────────────────────────────────
 
-def quality_multiplier(health_score: float, cert_score: float) -> float:
+def quality_multiplier(health_score: np.ndarray, cert_score: np.ndarray) -> np.ndarray:
     """
     QM(H,C) = 0.95 + 0.20×(H/100) + 0.10×(C/100), clipped [0.90, 1.25].
     """
     qm = 0.95 + 0.20 * (health_score / 100.0) + 0.10 * (cert_score / 100.0)
-    return round(max(0.90, min(1.25, qm)), 6)
+    return np.round(np.clip(qm, 0.90, 1.25), 6)
 
 
 # ─────────────────────────────────────────────
@@ -207,15 +222,14 @@ def quality_multiplier(health_score: float, cert_score: float) -> float:
 # ─────────────────────────────────────────────
 
 def calculate_total_value(
-    metrics: AnimalMetrics,
-    genetics_score: float,
-    health_score: float,
-    sustainability_score: float,
-    cert_score: float,
+    base_price_usd: np.ndarray,
+    gp: np.ndarray,
+    qm: np.ndarray,
+    sm: np.ndarray,
     listing_discount: float = 0.10,
-) -> float:
+) -> tuple[np.ndarray, np.ndarray]:
     """
-    Per-cow listing value (USD).
+    Per-cow (fair_value, listing_value) in USD.
 
     Formula:
         fair_value   = base_price_usd × GP(G) × QM(H,C) × SM(S)
@@ -225,13 +239,9 @@ def calculate_total_value(
     weight class at this stage (updated at each stage transition).
     Scores GP, QM, SM are locked at listing.
     """
-    gp = grade_premium(genetics_score)
-    qm = quality_multiplier(health_score, cert_score)
-    sm = sustainability_multiplier(sustainability_score)
-
-    fair_value = metrics.base_price_usd * gp * qm * sm
-    listing_value = fair_value * (1.0 - listing_discount)
-    return round(listing_value, 2)
+    fair_value = np.round(base_price_usd * gp * qm * sm, 2)
+    listing_value = np.round(fair_value * (1.0 - listing_discount), 2)
+    return fair_value, listing_value
 
 
 # ─────────────────────────────────────────────
@@ -265,3 +275,63 @@ def calculate_projected_roi(
         return 0.0
     multiplier = herd_total_discounted_value / listing_price
     return round((multiplier ** (1.0 / years_to_harvest) - 1.0) * 100.0, 2)
+
+
+# ─────────────────────────────────────────────
+# BATCH VALUATION (struct-of-arrays)
+# ─────────────────────────────────────────────
+
+@dataclass(slots=True)
+class AnimalMetricsArrays:
+    """
+    Per-animal inputs for the valuation engine as parallel arrays, one entry
+    per animal in each, NaN where an input is missing.
+
+    base_price_usd: Real USDA/AMS market value for this animal at its
+                    current stage (weight × $/cwt). Updated at each
+                    stage transition; scores stay locked.
+    """
+    stage_idx: np.ndarray               # int, STAGE_INDEX (len(STAGE_INDEX) = unknown)
+    is_genomic_enhanced: np.ndarray     # bool
+    verified_herd: np.ndarray           # bool
+    percentile_rank: np.ndarray
+    current_weight_lbs: np.ndarray
+    harvest_weight_mid_lbs: np.ndarray
+    base_price_usd: np.ndarray
+    num_cert_programs: np.ndarray       # int
+    days_on_feed: np.ndarray
+    fcr_score: np.ndarray
+    usrsb_score: np.ndarray
+
+
+def calculate_valuations(m: AnimalMetricsArrays, rng: np.random.Generator,
+                         listing_discount: float = 0.10) -> Dict[str, np.ndarray]:
+    """
+    The per-cow pipeline for every animal at once: the four scores, the
+    three multipliers and fair / listing value, keyed by cow_valuation column.
+    """
+    genetics = calculate_genetics_score(m.percentile_rank, m.is_genomic_enhanced, rng)
+    health = calculate_health_score(
+        m.verified_herd, m.current_weight_lbs, m.stage_idx, m.harvest_weight_mid_lbs, rng,
+    )
+    sustainability = calculate_sustainability_score(
+        m.days_on_feed, m.fcr_score, m.usrsb_score, rng,
+    )
+    certification = calculate_certification_score(m.num_cert_programs)
+
+    gp = grade_premium(genetics)
+    qm = quality_multiplier(health, certification)
+    sm = sustainability_multiplier(sustainability)
+    fair_value, listing_value = calculate_total_value(m.base_price_usd, gp, qm, sm, listing_discount)
+
+    return {
+        "genetics_score": genetics,
+        "health_score": health,
+        "sustainability_score": sustainability,
+        "certification_score": certification,
+        "grade_premium": gp,
+        "quality_mult": qm,
+        "sustainability_mult": sm,
+        "fair_value": fair_value,
+        "listing_value": listing_value,
+    }